@@ -0,0 +1,59 @@
+"""Response cache for FreeLLMs to skip the browser round trip on repeated prompts."""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+
+class LLMCache:
+    """
+    An LRU cache mapping prompt keys to LLM responses.
+
+    Every browser round trip to an LLM provider costs seconds to tens of seconds, so repeated
+    prompts are served from here instead. Entries are keyed on the model name plus the exact
+    prompt text and can optionally expire after `ttl` seconds. If `persist_path` is given, the
+    cache is loaded from that JSON file on start and written back on every set, so responses
+    survive process restarts.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None, persist_path: Optional[Union[str, Path]] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.persist_path = Path(persist_path) if persist_path is not None else None
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._entries: "OrderedDict[str, Tuple[str, Optional[float]]]" = OrderedDict()
+        if self.persist_path is not None and self.persist_path.exists():
+            for key, (value, expires_at) in json.loads(self.persist_path.read_text()).items():
+                self._entries[key] = (value, expires_at)
+
+    @staticmethod
+    def make_key(model_name: Optional[str], prompt: str) -> str:
+        """Build a stable cache key from the model name and the exact prompt text."""
+        return hashlib.sha256(json.dumps({"model": model_name, "prompt": prompt}, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for `key`, or None on a miss or an expired entry."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at is None or expires_at > time.time():
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return value
+            del self._entries[key]
+        self.stats["misses"] += 1
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response under `key`, evicting the least recently used entry when full."""
+        # Wall-clock time, not time.monotonic(): the deadline is persisted and monotonic clocks have no meaning across reboots
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        if self.persist_path is not None:
+            self.persist_path.write_text(json.dumps(dict(self._entries)))
@@ -1,2 +1,17 @@
 DEFAULT_WINDOW_SIZE = (1920, 1080)
-DRIVERS_DEFAULT_CONFIG = ["--disable-gpu", f"--window-size={DEFAULT_WINDOW_SIZE[0]},{DEFAULT_WINDOW_SIZE[1]}", "--no-sandbox"]
+DRIVERS_DEFAULT_CONFIG = [
+    "--disable-gpu",
+    f"--window-size={DEFAULT_WINDOW_SIZE[0]},{DEFAULT_WINDOW_SIZE[1]}",
+    "--no-sandbox",
+    # Flags below trim Chrome's startup cost and mute background services that keep the browser busy between commands
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+]
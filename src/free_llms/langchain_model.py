@@ -1,10 +1,13 @@
-from typing import Any, Dict, List, Optional, Type, Union
+import asyncio
+import importlib
+from functools import partial
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
-from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
 from langchain_core.language_models.llms import LLM
 from langchain_core.pydantic_v1 import root_validator
 
-from free_llms.models import ClaudeChrome, GPTChrome, MistralChrome, PreplexityChrome
+from free_llms.cache import LLMCache
 
 
 class FreeLLMs(LLM):
@@ -14,21 +17,35 @@ class FreeLLMs(LLM):
     """One of the following model names to choose from: GPTChrome,PreplexityChrome,MistralChrome,ClaudeChrome"""
     llm_kwargs: Dict[str, Any]
     """Keyword arguments to be passed to free_llms.models.LLMChrome"""
+    isolate_calls: bool = False
+    """Whether to clear cookies before every call so calls do not share browser state. Defaults to False"""
+    response_cache: Optional[LLMCache] = None
+    """Optional response cache checked before driving the browser. Defaults to None i.e no caching.
+    Named response_cache because the inherited langchain `cache` field is resolved by langchain_core itself"""
+
+    _MODEL_REGISTRY: ClassVar[Dict[str, Tuple[str, str]]] = {
+        "GPTChrome": ("free_llms.models", "GPTChrome"),
+        "PreplexityChrome": ("free_llms.models", "PreplexityChrome"),
+        "MistralChrome": ("free_llms.models", "MistralChrome"),
+        "ClaudeChrome": ("free_llms.models", "ClaudeChrome"),
+    }
+    """Registry of the supported browser clients, resolved lazily so importing this module does not pull in the whole selenium stack"""
+    _MODEL_NAMES: ClassVar[List[str]] = list(_MODEL_REGISTRY)
+    """Names of the supported browser clients, used in error messages"""
 
     @root_validator()
     def start_model(cls, values: Dict) -> Dict:
         """Validate that api key and python package exists in environment."""
 
-        models: Dict[str, Type[Union[ClaudeChrome, GPTChrome, MistralChrome, PreplexityChrome]]] = {
-            "GPTChrome": GPTChrome,
-            "PreplexityChrome": PreplexityChrome,
-            "MistralChrome": MistralChrome,
-            "ClaudeChrome": ClaudeChrome,
-        }
-        if values["model_name"] not in models:
-            raise ValueError(f'The given model {values["model_name"]} is not correct. Please pass one of the following {list(models.keys())}')
+        registered = cls._MODEL_REGISTRY.get(values["model_name"])
+        if registered is None:
+            raise ValueError(f'The given model {values["model_name"]} is not correct. Please pass one of the following {cls._MODEL_NAMES}')
         else:
-            values["client"] = models[values["model_name"]](**values["llm_kwargs"])
+            module_name, class_name = registered
+            model_cls = getattr(importlib.import_module(module_name), class_name)
+            values["client"] = model_cls(**values["llm_kwargs"])
+            if not values["client"].login(values["client"].retries_attempt):
+                raise ValueError("Cannot Login given the credentials")
         return values
 
     @property
@@ -43,8 +60,42 @@ class FreeLLMs(LLM):
         run_manager: Optional[CallbackManagerForLLMRun] = None,
         **kwargs: Any,
     ) -> str:
-        if not self.client.login():
-            raise ValueError("Cannot Login given the credentials")
+        if self.response_cache is not None:
+            key = LLMCache.make_key(self.model_name, prompt)
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                return cached
+        if self.isolate_calls:
+            self.client.driver.delete_all_cookies()
         answer = self.client.send_prompt(prompt).content
-        self.client.driver.quit()
+        if self.response_cache is not None:
+            self.response_cache.set(key, answer)
         return answer
+
+    async def _acall(
+        self,
+        prompt: str,
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> str:
+        """Runs _call in a thread pool so the browser wait does not block the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(None, partial(self._call, prompt, stop, None, **kwargs))
+
+    def close(self) -> None:
+        """Quit the underlying browser session. After this the model cannot be invoked again."""
+        self.client.driver.quit()
+
+    def __enter__(self) -> "FreeLLMs":
+        """Enters the runtime context related to this object (for use in 'with' statements)."""
+        return self
+
+    def __exit__(self, *args: Any, **kwargs: Any) -> None:
+        """Exits the runtime context and closes the browser session."""
+        self.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -1,24 +1,39 @@
-import io
+import asyncio
 import os
 import time
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from typing import Any, ClassVar, Deque, Dict, Final, List, Optional, Tuple
 
 import undetected_chromedriver as uc
-from bs4 import BeautifulSoup
+import urllib3
 from langchain_core.callbacks import BaseCallbackHandler, RunManager
 from langchain_core.messages import AIMessage, HumanMessage
-from pydantic import BaseModel, model_validator
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from pydantic import BaseModel, PrivateAttr, model_validator
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from free_llms.callbacks import StdOutCallbackHandler
 from free_llms.constants import DRIVERS_DEFAULT_CONFIG
+from free_llms.pool import DRIVER_POOL
 from free_llms.utils import configure_options
 
+_PERPLEXITY_SUBMIT_CSS: Final[str] = r"#__next > main > div > div > div.grow.lg\:pr-sm.lg\:pb-sm.lg\:pt-sm > div > div > div > div.relative.flex.h-full.flex-col > div.mt-lg.w-full.grow.items-center.md\:mt-0.md\:flex.border-borderMain\/50.ring-borderMain\/50.divide-borderMain\/50.dark\:divide-borderMainDark\/50.dark\:ring-borderMainDark\/50.dark\:border-borderMainDark\/50.bg-transparent > div > div > span > div > div > div.bg-background.dark\:bg-offsetDark.flex.items-center.space-x-2.justify-self-end.rounded-full.col-start-3.row-start-2.-mr-2 > button"  # noqa: E501
+"""Perplexity's submit-button selector, hoisted so the single interned string is shared by every instance. The backslashes are CSS escapes"""
+
+_DEFAULT_CALLBACKS: Final[List[BaseCallbackHandler]] = [StdOutCallbackHandler(color="green")]
+"""Default handler list shared across sessions instead of instantiating a handler per LLMChrome"""
+
 
 class LLMChrome(BaseModel, ABC):
     """
@@ -28,6 +43,8 @@ class LLMChrome(BaseModel, ABC):
 
     You can also explicitly set up your chrome browser version by the env variable `CHROME_VERSION`.
 
+    The browser runs headful by default. Pass `--headless` in your driver config to opt into Chrome's new headless mode.
+
     Methods:
     login(email: str, password: str, waiting_time: int = 10) -> bool:
         Logs into the language model interface using the provided email and password.
@@ -52,8 +69,6 @@ class LLMChrome(BaseModel, ABC):
     """UnDetected Chrome Driver. This is started automatically and client do not need to provide."""
     driver_config: List[str]
     """Configuration for UnDetected Chrome Driver."""
-    messages: List[Tuple[HumanMessage, AIMessage]] = []
-    """Messages in the current session"""
     retries_attempt: int = 3
     """How many login attempts do we need to make otherwise we raise error"""
     callbacks: List[BaseCallbackHandler] = []
@@ -64,6 +79,27 @@ class LLMChrome(BaseModel, ABC):
     """Whether you want to print logs. Defaults to True"""
     message_box_jump: int = 2
     """For some models we need to increment this to get the next message in the current session from the selnium elements visible on screen"""
+    pool_maxsize: int = 20
+    """Size of the urllib3 connection pool used to talk to the chrome driver. Selenium defaults to 1 which serializes every command"""
+    user_data_dir: Optional[str] = None
+    """Directory for a persistent Chrome profile. Reusing one keeps the browser cache and login cookies warm across runs"""
+    _human_contents: Deque[str] = PrivateAttr(default_factory=deque)
+    """Raw contents of the human messages in the current session"""
+    _ai_contents: Deque[str] = PrivateAttr(default_factory=deque)
+    """Raw contents of the AI messages in the current session"""
+    _wait: WebDriverWait = PrivateAttr()
+    """Reused WebDriverWait, built once per session instead of once per element lookup"""
+
+    _LOCATE_TARGET_JS: ClassVar[str] = (
+        "var target = null;"
+        "if (arguments[0] === 'css selector') {"
+        " var nodes = document.querySelectorAll(arguments[1]);"
+        " target = nodes.length ? nodes[nodes.length - 1] : null;"
+        "} else {"
+        " target = document.evaluate(arguments[1], document, null, 9, null).singleNodeValue;"
+        "}"
+    )
+    """JS prelude resolving a (By, value) locator to `target`, taking the last match for CSS selectors"""
 
     class Config:
         """Configuration for this pydantic object."""
@@ -73,9 +109,11 @@ class LLMChrome(BaseModel, ABC):
     @model_validator(mode="before")
     @classmethod
     def start_run_manger(cls, data: Dict) -> Dict:
+        if data.get("run_manager") is not None:  # Callers juggling many short-lived sessions can share one pre-built RunManager
+            return data
         if "callbacks" not in data:
-            data["callbacks"] = [StdOutCallbackHandler(color="green")]
-        data["run_manager"] = RunManager(run_id=uuid.uuid1(), handlers=data["callbacks"], inheritable_handlers=[])
+            data["callbacks"] = _DEFAULT_CALLBACKS
+        data["run_manager"] = RunManager(run_id=uuid.uuid4(), handlers=data["callbacks"], inheritable_handlers=[])
         return data
 
     @model_validator(mode="before")
@@ -89,19 +127,45 @@ class LLMChrome(BaseModel, ABC):
             raise ValueError("You cannot pass in an already started driver")
         if "message_jump" in data:
             raise ValueError("You cannot set message jump")
-        for default_config in DRIVERS_DEFAULT_CONFIG:
-            if default_config in data["driver_config"]:
-                raise ValueError(f"You cannot put in {default_config} in your provided driver config")
-        for started_config in data["driver_config"]:
-            if "--window-size" in started_config:
-                raise ValueError("You cannot change the window size in your provided driver config")
-        options = configure_options(data["driver_config"] + DRIVERS_DEFAULT_CONFIG)
-        _chrome_version = os.environ.get("CHROME_VERSION", None)
-        data["driver"] = uc.Chrome(
-            options=options, version_main=int(_chrome_version) if _chrome_version is not None else _chrome_version, headless=True
-        )
+        conflicts = set(DRIVERS_DEFAULT_CONFIG) & set(data["driver_config"])
+        if conflicts:
+            raise ValueError(f"You cannot put in {', '.join(sorted(conflicts))} in your provided driver config")
+        if any(config.startswith("--window-size") for config in data["driver_config"]):
+            raise ValueError("You cannot change the window size in your provided driver config")
+        driver_config = list(data["driver_config"])
+        if "--headless" in driver_config:  # Headless is opt-in and uses the new headless mode which shares the headful rendering pipeline
+            driver_config[driver_config.index("--headless")] = "--headless=new"
+        if data.get("user_data_dir") is not None and not any(config.startswith("--user-data-dir") for config in driver_config):
+            driver_config.append(f"--user-data-dir={data['user_data_dir']}")
+        data["driver_config"] = driver_config  # Keep the applied configuration so __exit__ pools the driver under the same key
+        data["driver"] = DRIVER_POOL.acquire(driver_config + DRIVERS_DEFAULT_CONFIG)
+        if data["driver"] is None:
+            options = configure_options(driver_config + DRIVERS_DEFAULT_CONFIG)
+            _chrome_version = os.environ.get("CHROME_VERSION", None)
+            data["driver"] = uc.Chrome(options=options, version_main=int(_chrome_version) if _chrome_version is not None else _chrome_version)
+            try:  # Media, fonts and telemetry are never needed for the DOM interactions; blocking them shortens every page load
+                data["driver"].execute_cdp_cmd("Network.enable", {})
+                data["driver"].execute_cdp_cmd(
+                    "Network.setBlockedURLs",
+                    {"urls": ["*.png", "*.jpg", "*.webp", "*.svg", "*.woff2", "*.mp4", "*/analytics*", "*/telemetry*"]},
+                )
+            except WebDriverException:
+                pass
+        executor = data["driver"].command_executor
+        # Widen the driver connection pool so commands reuse keep-alive connections instead of waiting on a single one.
+        # Only when selenium built a _conn (it skips it for non-keep-alive clients); the replacement drops the timeout and
+        # ca_certs the original manager carried, which is harmless for local chromedriver over plain HTTP but would matter
+        # for a remote executor.
+        if hasattr(executor, "_conn"):
+            executor._conn = urllib3.PoolManager(maxsize=data.get("pool_maxsize", 20), block=False)
         return data
 
+    @model_validator(mode="after")
+    def build_wait(self) -> "LLMChrome":
+        """Builds the single WebDriverWait reused by every element lookup. Polling at 200ms instead of selenium's 500ms default."""
+        self._wait = WebDriverWait(self.driver, self.waiting_time, poll_frequency=0.2, ignored_exceptions=(StaleElementReferenceException,))
+        return self
+
     @property
     @abstractmethod
     def _model_url(self) -> str:
@@ -114,6 +178,11 @@ class LLMChrome(BaseModel, ABC):
         """A dictionary containing identifiers for various elements on the page"""
         pass
 
+    @property
+    def messages(self) -> List[Tuple[HumanMessage, AIMessage]]:
+        """Messages in the current session. The Message objects are only materialized when asked for."""
+        return [(HumanMessage(content=human), AIMessage(content=ai)) for human, ai in zip(self._human_contents, self._ai_contents)]
+
     @property
     def session_history(self) -> List[Tuple[HumanMessage, AIMessage]]:
         """All of the messages in the current session in the form of Human and AI pairs."""
@@ -146,6 +215,142 @@ class LLMChrome(BaseModel, ABC):
         """
         pass
 
+    async def asend_prompt(self, query: str) -> AIMessage:
+        """
+        Asynchronous version of send_prompt.
+
+        Runs the blocking browser interaction in the default thread executor, so several
+        LLMChrome sessions in one process can overlap their waits on streaming responses.
+
+        Args:
+        query (str): The query to send to LLM Provider.
+
+        Returns:
+        str: The response from LLM Provider.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.send_prompt, query)
+
+    def export_session(self) -> Dict[str, Any]:
+        """
+        Exports the authenticated browser session for use outside Selenium.
+
+        Driving a full Chromium process for what is ultimately an HTTPS request is the biggest
+        cost in this package. After login has succeeded, the cookies and user agent returned
+        here can be attached to a plain HTTP client to call the provider's own endpoints
+        directly, keeping the browser only as the authentication step.
+        """
+        return {
+            "cookies": {cookie["name"]: cookie["value"] for cookie in self.driver.get_cookies()},
+            "user_agent": self.driver.execute_script("return navigator.userAgent"),
+            "url": self.driver.current_url,
+        }
+
+    def _fill_prompt(self, element: WebElement, text: str) -> None:
+        """
+        Injects `text` into the prompt element in one driver round trip.
+
+        send_keys dispatches one key event per character, so long prompts cost hundreds of driver
+        commands. The value is instead assigned through the native setter (so React-controlled
+        inputs register the change) and a single input event is dispatched. Falls back to
+        send_keys when script injection fails.
+        """
+        fill_script = (
+            "var el = arguments[0], text = arguments[1];"
+            "el.focus();"
+            "if (el.tagName === 'TEXTAREA' || el.tagName === 'INPUT') {"
+            " var proto = el.tagName === 'TEXTAREA' ? window.HTMLTextAreaElement.prototype : window.HTMLInputElement.prototype;"
+            " Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, text);"
+            "} else {"
+            " el.innerText = text;"
+            "}"
+            "el.dispatchEvent(new Event('input', {bubbles: true}));"
+        )
+        try:
+            self.driver.execute_script(fill_script, element, text)
+        except JavascriptException:
+            element.send_keys(text)
+
+    def _inner_html_fingerprint(self, locator: Tuple[str, str]) -> int:
+        """
+        Returns a cheap rolling hash of the innerHTML of the element at `locator` in a single driver round trip.
+
+        Hashing instead of comparing lengths: a streaming rewrite that swaps equal-length content
+        would make a pure length comparison declare stability too early. The hash is computed in
+        the page so only one integer ever crosses the wire.
+        """
+        fingerprint_script = self._LOCATE_TARGET_JS + (
+            "var s = (target || {innerHTML: ''}).innerHTML;"
+            "var h = 0;"
+            "for (var i = 0; i < s.length; i++) { h = (h * 31 + s.charCodeAt(i)) | 0; }"
+            "return h;"
+        )
+        return self.driver.execute_script(fingerprint_script, *locator)
+
+    def _text_content(self, locator: Tuple[str, str]) -> str:
+        """
+        Returns the textContent of the element at `locator` in a single driver round trip.
+
+        textContent is read instead of innerHTML: the browser skips HTML serialization, fewer
+        bytes cross the wire, and callers get the plain answer without parsing markup out of it.
+        """
+        return self.driver.execute_script(self._LOCATE_TARGET_JS + "return (target || {textContent: ''}).textContent", *locator)
+
+    def _poll_until_stable(self, locator: Tuple[str, str], provider: str) -> str:
+        """
+        Polls the streaming element at `locator` until its content stops changing and returns its textContent.
+
+        Samples an innerHTML fingerprint every 500ms instead of busy-looping, and only declares the
+        stream finished after three consecutive quiet samples so a transient network pause is not
+        mistaken for completion. Gives up at a hard deadline of six times the waiting time.
+        """
+        quiet, last_fingerprint = 0, None
+        deadline = time.monotonic() + self.waiting_time * 6
+        # Bind hot attributes once; pydantic resolves every field access through its descriptors, which adds up in a polling loop
+        probe, on_text, verbosity = self._inner_html_fingerprint, self.run_manager.on_text, self.verbosity
+        while quiet < 3 and time.monotonic() < deadline:
+            time.sleep(0.5)
+            current_fingerprint = probe(locator)
+            quiet = quiet + 1 if current_fingerprint == last_fingerprint else 0
+            last_fingerprint = current_fingerprint
+            on_text(text=f"{provider} is responding", verbose=verbosity)
+        return self._text_content(locator)
+
+    def _wait_streaming_finished(self, locator: Tuple[str, str], quiet_ms: int = 800) -> Optional[str]:
+        """
+        Waits for the streaming response at `locator` to stop mutating and returns its final textContent.
+
+        A MutationObserver is installed on the element so completion is detected in the browser
+        itself (no fixed sleep and no repeated DOM reads): once the element has been quiet for
+        `quiet_ms` milliseconds the observer disconnects and publishes the final textContent.
+        Returns None when the observer cannot be installed or times out, so that callers can
+        fall back to polling.
+        """
+        observer_script = self._LOCATE_TARGET_JS + (
+            "if (target === null) { return false; }"
+            "var quiet = arguments[2];"
+            "window.__free_llms_stream = null;"
+            "var mutated = false;"
+            "var finish = null;"
+            "var timer = null;"
+            "var observer = new MutationObserver(function() { mutated = true; clearTimeout(timer); timer = setTimeout(finish, quiet); });"
+            # An empty element that has never mutated is a bubble still waiting for its first token, not a finished answer: re-arm.
+            # The result is published as an object so an empty-but-finished answer still reads as a truthy sentinel.
+            "finish = function() {"
+            " if (!mutated && target.textContent === '') { timer = setTimeout(finish, quiet); return; }"
+            " observer.disconnect(); window.__free_llms_stream = {text: target.textContent};"
+            "};"
+            "observer.observe(target, {childList: true, subtree: true, characterData: true});"
+            "timer = setTimeout(finish, quiet);"
+            "return true;"
+        )
+        try:
+            if not self.driver.execute_script(observer_script, *locator, quiet_ms):
+                return None
+            result = WebDriverWait(self.driver, self.waiting_time * 6).until(lambda driver: driver.execute_script("return window.__free_llms_stream"))
+            return result["text"]
+        except (JavascriptException, TimeoutException):
+            return None
+
     def __enter__(self) -> "LLMChrome":
         """
         Enters the runtime context related to this object (for use in 'with' statements).
@@ -157,9 +362,10 @@ class LLMChrome(BaseModel, ABC):
 
     def __exit__(self, *args: Any, **kwargs: Any) -> None:
         """
-        Exits the runtime context and closes the browser session.
+        Exits the runtime context and parks the browser in the warm pool so the next
+        session with the same driver configuration skips the Chrome launch.
         """
-        self.driver.quit()
+        DRIVER_POOL.release(self.driver_config + DRIVERS_DEFAULT_CONFIG, self.driver)
 
 
 class GPTChrome(LLMChrome):
@@ -172,179 +378,204 @@ class GPTChrome(LLMChrome):
         print(response)
     """
 
-    message_box_jump: int = 3
-    """For the GPT Chrome, the starting message box is at 3"""
+    _ELEMENTS_IDENTIFIER: ClassVar[Dict[str, str]] = {
+        "Prompt_Text_Area": "prompt-textarea",
+        "Prompt_Text_Output": 'div[data-message-author-role="assistant"]',
+    }
+
+    _MODEL_URL: ClassVar[str] = "https://chatgpt.com/"
 
     @property
     def _model_url(self) -> str:
-        return "https://chatgpt.com/"
+        return self._MODEL_URL
 
     @property
     def _elements_identifier(self) -> Dict[str, str]:
-        return {
-            "Prompt_Text_Area": "prompt-textarea",
-            "Prompt_Text_Output": "/html/body/div[1]/div[1]/div[2]/main/div[2]/div[1]/div/div/div/div/div[{current}]/div/div/div[2]/div[2]/div[1]/div/div",  # noqa: E501
-        }
+        return self._ELEMENTS_IDENTIFIER
 
     def login(self, retries_attempt: int = 3) -> bool:
         self.driver.get(self._model_url)
         return True
 
     def send_prompt(self, query: str) -> AIMessage:
-        text_area = WebDriverWait(self.driver, self.waiting_time).until(
+        text_area = self._wait.until(
             EC.presence_of_element_located((By.ID, self._elements_identifier["Prompt_Text_Area"]))
         )
 
         text_area.click()
-        text_area.send_keys(query)
+        self._fill_prompt(text_area, query)
         self.run_manager.on_text(text=f"Human Message: {query} send to ChatGPT", verbose=self.verbosity)
+        output_locator = (By.CSS_SELECTOR, self._elements_identifier["Prompt_Text_Output"])
+        previous_messages = len(self.driver.find_elements(*output_locator))
         text_area.submit()
-        raw_message = ""
-        time.sleep(self.waiting_time)  # Wait for the query to be processed
-        current_n, prev_n = 0, -1
-        while current_n != prev_n:
-            prev_n = current_n
-            streaming = self.driver.find_element(By.XPATH, self._elements_identifier["Prompt_Text_Output"].format(current=self.message_box_jump))
-            raw_message = streaming.get_attribute("innerHTML")
-            self.run_manager.on_text(text="ChatGPT is responding", verbose=self.verbosity)
-            current_n = len(raw_message) if raw_message is not None else 0
-        self.message_box_jump += 2
+        self._wait.until(lambda driver: len(driver.find_elements(*output_locator)) > previous_messages)
+        self.run_manager.on_text(text="ChatGPT is responding", verbose=self.verbosity)
+        raw_message = self._wait_streaming_finished(output_locator)
+        if raw_message is None:  # Fall back to polling when the observer could not be installed
+            raw_message = self._poll_until_stable(output_locator, "ChatGPT")
         self.run_manager.on_text(text=f"ChatGPT responded with {len(raw_message)} characters", verbose=self.verbosity)
-        self.messages.append((HumanMessage(content=query), AIMessage(content=raw_message)))
+        self._human_contents.append(query)
+        self._ai_contents.append(raw_message)
         return AIMessage(content=raw_message)
 
 
 class PreplexityChrome(LLMChrome):
     """Note: Preplexity does not right no build on previous conversation. Every Message is a new request"""
 
+    _first_call: bool = PrivateAttr(default=True)
+    """Whether send_prompt has navigated to the SPA yet. Later calls route back home client side instead of a full page load"""
+
+    _ELEMENTS_IDENTIFIER: ClassVar[Dict[str, str]] = {
+        "Prompt_Text_Area": "/html/body/div/main/div/div/div/div/div/div/div[1]/div[2]/div/div/span/div/div/textarea",
+        "Prompt_Text_Area_Submit": _PERPLEXITY_SUBMIT_CSS,
+        "Prompt_Text_Area_Output": "/html/body/div/main/div/div/div/div/div/div[2]/div[1]/div/div/div[1]/div/div/div[3]/div/div[1]/div[2]/div/div[2]",  # noqa: E501
+        "Prompt_Text_Area_Output_Related": "/html/body/div/main/div/div/div/div/div/div[2]/div[1]/div/div/div[1]/div/div/div[3]/div/div[1]/div[3]/div/div",  # noqa: E501
+        "App_Download_Button": "/html/body/div[1]/main/div[3]/div/div/div/div[2]/div[1]/div/div/button",
+    }
+
+    _MODEL_URL: ClassVar[str] = "https://www.perplexity.ai/"
+
     @property
     def _model_url(self) -> str:
-        return "https://www.perplexity.ai/"
+        return self._MODEL_URL
 
     @property
     def _elements_identifier(self) -> Dict[str, str]:
-        return {
-            "Prompt_Text_Area": "/html/body/div/main/div/div/div/div/div/div/div[1]/div[2]/div/div/span/div/div/textarea",
-            "Prompt_Text_Area_Submit": "#__next > main > div > div > div.grow.lg\:pr-sm.lg\:pb-sm.lg\:pt-sm > div > div > div > div.relative.flex.h-full.flex-col > div.mt-lg.w-full.grow.items-center.md\:mt-0.md\:flex.border-borderMain\/50.ring-borderMain\/50.divide-borderMain\/50.dark\:divide-borderMainDark\/50.dark\:ring-borderMainDark\/50.dark\:border-borderMainDark\/50.bg-transparent > div > div > span > div > div > div.bg-background.dark\:bg-offsetDark.flex.items-center.space-x-2.justify-self-end.rounded-full.col-start-3.row-start-2.-mr-2 > button",  # noqa: E501
-            "Prompt_Text_Area_Output": "/html/body/div/main/div/div/div/div/div/div[2]/div[1]/div/div/div[1]/div/div/div[3]/div/div[1]/div[2]/div/div[2]",  # noqa: E501
-            "Prompt_Text_Area_Output_Related": "/html/body/div/main/div/div/div/div/div/div[2]/div[1]/div/div/div[1]/div/div/div[3]/div/div[1]/div[3]/div/div",  # noqa: E501
-            "App_Download_Button": "/html/body/div[1]/main/div[3]/div/div/div/div[2]/div[1]/div/div/button",
-        }
+        return self._ELEMENTS_IDENTIFIER
 
     def login(self, retries_attempt: int = 3) -> bool:
         """With Perplexity we are going to stick to anonymous session"""
         return True
 
     def send_prompt(self, query: str) -> AIMessage:
-        self.driver.get(self._model_url)
-        text_area = WebDriverWait(self.driver, self.waiting_time).until(
-            EC.element_to_be_clickable((By.XPATH, self._elements_identifier["Prompt_Text_Area"]))
-        )
+        if self._first_call:
+            self.driver.get(self._model_url)
+            self._first_call = False
+        else:  # The SPA is already loaded; route back to the home prompt client side instead of re-fetching the whole document
+            self.driver.execute_script("history.pushState({}, '', '/');")
+        try:
+            text_area = self._wait.until(
+                EC.element_to_be_clickable((By.XPATH, self._elements_identifier["Prompt_Text_Area"]))
+            )
+        except TimeoutException:  # The SPA router did not bring the prompt back; fall back to a full navigation
+            self.driver.get(self._model_url)
+            text_area = self._wait.until(
+                EC.element_to_be_clickable((By.XPATH, self._elements_identifier["Prompt_Text_Area"]))
+            )
 
         text_area.click()
-        text_area.send_keys(query)
-        text_area_submit = WebDriverWait(self.driver, self.waiting_time).until(
+        self._fill_prompt(text_area, query)
+        text_area_submit = self._wait.until(
             EC.element_to_be_clickable((By.CSS_SELECTOR, self._elements_identifier["Prompt_Text_Area_Submit"]))
         )
         text_area_submit.click()
         self.run_manager.on_text(text=f"Human Message: {query} send to Preplexity", verbose=self.verbosity)
         raw_message: Optional[str] = ""
-        while True:
+        for attempt in range(self.retries_attempt):
             try:
-                WebDriverWait(self.driver, self.waiting_time).until(
-                    EC.visibility_of_element_located((By.XPATH, self._elements_identifier["Prompt_Text_Area_Output_Related"]))
-                )
-                text_area_output = WebDriverWait(self.driver, self.waiting_time).until(
-                    EC.visibility_of_element_located((By.XPATH, self._elements_identifier["Prompt_Text_Area_Output"]))
+                # Both elements appear nearly together; one compound wait checks them per poll tick instead of two back-to-back waits
+                _, text_area_output = self._wait.until(
+                    EC.all_of(
+                        EC.visibility_of_element_located((By.XPATH, self._elements_identifier["Prompt_Text_Area_Output_Related"])),
+                        EC.visibility_of_element_located((By.XPATH, self._elements_identifier["Prompt_Text_Area_Output"])),
+                    )
                 )
-                raw_message = text_area_output.get_attribute("innerHTML")
+                # textContent skips the browser-side HTML serialization and makes the Python-side markup stripping unnecessary
+                raw_message = self.driver.execute_script("return arguments[0].textContent;", text_area_output)
                 break
             except TimeoutException:
                 try:
                     app_download_button = self.driver.find_element(By.XPATH, self._elements_identifier["App_Download_Button"])
                     app_download_button.click()
                 except NoSuchElementException:
-                    continue
+                    time.sleep(min(0.2 * 2**attempt, 2.0))  # Back off instead of spinning driver commands while the page settles
             self.run_manager.on_text(text="Preplexity is responding", verbose=self.verbosity)
+        else:
+            raise TimeoutException(f"Preplexity response did not appear after {self.retries_attempt} attempts")
         if raw_message is None:
             raw_message = ""
         self.run_manager.on_text(text=f"Preplexity responded with {len(raw_message)} characters", verbose=self.verbosity)
-        processed_message = BeautifulSoup(io.StringIO(raw_message)).get_text()
-        self.messages.append((HumanMessage(content=query), AIMessage(content=processed_message)))
-        return AIMessage(content=processed_message)
+        self._human_contents.append(query)
+        self._ai_contents.append(raw_message)
+        return AIMessage(content=raw_message)
 
 
 class MistralChrome(LLMChrome):
     message_box_jump: int = 2
     """For the Mistral Chrome, the starting message box is at 2"""
 
+    _ELEMENTS_IDENTIFIER: ClassVar[Dict[str, str]] = {
+        "Email": ":Rclkn:",
+        "Password": ":Rklkn:",
+        "Login_Button": "/html/body/main/div/div[1]/div/div/div[2]/div/form[2]/div[3]/div[2]/div/button",
+        "Prompt_Text_Area": "/html/body/div[1]/div[2]/div[2]/div/div[2]/div/div[1]/div/textarea",
+        "Prompt_Text_Area_Submit": "/html/body/div[1]/div[2]/div[2]/div/div[2]/div/div[1]/div/button",
+        "Prompt_Text_Area_Output": "/html/body/div[1]/div[2]/div[2]/div/div[1]/div[1]/div[{current}]/div[2]/div[1]",
+    }
+
+    _MODEL_URL: ClassVar[str] = "https://chat.mistral.ai/chat"
+
     @property
     def _model_url(self) -> str:
-        return "https://chat.mistral.ai/chat"
+        return self._MODEL_URL
 
     @property
     def _elements_identifier(self) -> Dict[str, str]:
-        return {
-            "Email": ":Rclkn:",
-            "Password": ":Rklkn:",
-            "Login_Button": "/html/body/main/div/div[1]/div/div/div[2]/div/form[2]/div[3]/div[2]/div/button",
-            "Prompt_Text_Area": "/html/body/div[1]/div[2]/div[2]/div/div[2]/div/div[1]/div/textarea",
-            "Prompt_Text_Area_Submit": "/html/body/div[1]/div[2]/div[2]/div/div[2]/div/div[1]/div/button",
-            "Prompt_Text_Area_Output": "/html/body/div[1]/div[2]/div[2]/div/div[1]/div[1]/div[{current}]/div[2]/div[1]",
-        }
+        return self._ELEMENTS_IDENTIFIER
 
     def login(self, retries_attempt: int = 3) -> bool:
         self.driver.get(self._model_url)
-
+        try:  # A persisted profile may still hold the login cookies, in which case the chat page loads straight away
+            WebDriverWait(self.driver, 3).until(EC.presence_of_element_located((By.XPATH, self._elements_identifier["Prompt_Text_Area"])))
+            self.run_manager.on_text(text="Already logged in on Mistral", verbose=self.verbosity)
+            return True
+        except TimeoutException:
+            pass
         for i in range(retries_attempt):
             self.run_manager.on_text(text=f"Making login attempt no. {i+1} on Mistral", verbose=self.verbosity)
             try:
-                email_input = WebDriverWait(self.driver, self.waiting_time).until(
-                    EC.presence_of_element_located((By.ID, self._elements_identifier["Email"]))
-                )
-                email_input.click()
-                email_input.send_keys(self.email)
-                password_button = WebDriverWait(self.driver, self.waiting_time).until(
-                    EC.element_to_be_clickable((By.ID, self._elements_identifier["Password"]))
+                # Both inputs appear together once the login route resolves, so one compound wait and two script fills replace four round trips
+                email_input, password_input = self._wait.until(
+                    EC.all_of(
+                        EC.presence_of_element_located((By.ID, self._elements_identifier["Email"])),
+                        EC.element_to_be_clickable((By.ID, self._elements_identifier["Password"])),
+                    )
                 )
-                password_button.clear()
-                password_button.click()
-                password_button.send_keys(self.password)
-                login_button = WebDriverWait(self.driver, self.waiting_time).until(
+                self._fill_prompt(email_input, self.email)
+                self._fill_prompt(password_input, self.password)
+                login_button = self._wait.until(
                     EC.element_to_be_clickable((By.XPATH, self._elements_identifier["Login_Button"]))
                 )
                 login_button.click()
-                WebDriverWait(self.driver, self.waiting_time).until(
+                self._wait.until(
                     EC.presence_of_element_located((By.XPATH, self._elements_identifier["Prompt_Text_Area"]))
                 )
                 self.run_manager.on_text(text=f"Login succeed on attempt no. {i+1}", verbose=self.verbosity)
                 return True
             except TimeoutException:
+                time.sleep(2**i)  # Back off before retrying so a slow page is not hammered with reloads
                 continue
         return False
 
     def send_prompt(self, query: str) -> AIMessage:
-        text_area = WebDriverWait(self.driver, self.waiting_time).until(
+        text_area = self._wait.until(
             EC.presence_of_element_located((By.XPATH, self._elements_identifier["Prompt_Text_Area"]))
         )
         text_area.click()
-        text_area.send_keys(query)
-        text_area_submit_button = WebDriverWait(self.driver, self.waiting_time).until(
+        self._fill_prompt(text_area, query)
+        text_area_submit_button = self._wait.until(
             EC.presence_of_element_located((By.XPATH, self._elements_identifier["Prompt_Text_Area_Submit"]))
         )
         text_area_submit_button.click()
-        time.sleep(self.waiting_time)  # Wait for the query to be processed
-        current_n, prev_n = 0, -1
-        while current_n != prev_n:
-            prev_n = current_n
-            streaming = self.driver.find_element(By.XPATH, self._elements_identifier["Prompt_Text_Area_Output"].format(current=self.message_box_jump))
-            raw_message = streaming.get_attribute("innerHTML")
-            self.run_manager.on_text(text="Mistral is responding", verbose=self.verbosity)
-            current_n = len(raw_message) if raw_message is not None else 0
-
+        output_locator = (By.XPATH, self._elements_identifier["Prompt_Text_Area_Output"].format(current=self.message_box_jump))
+        self._wait.until(EC.presence_of_element_located(output_locator))  # Returns as soon as the response starts instead of a fixed sleep
+        raw_message = self._wait_streaming_finished(output_locator)
+        if raw_message is None:  # Fall back to polling when the observer could not be installed
+            raw_message = self._poll_until_stable(output_locator, "Mistral")
         self.message_box_jump += 2
         self.run_manager.on_text(text=f"Mistral responded with {len(raw_message)} characters", verbose=self.verbosity)
-        self.messages.append((HumanMessage(content=query), AIMessage(content=raw_message)))
+        self._human_contents.append(query)
+        self._ai_contents.append(raw_message)
         return AIMessage(content=raw_message)
 
 
@@ -352,78 +583,87 @@ class ClaudeChrome(LLMChrome):
     message_box_jump: int = 2
     """For the Claude Chrome, the starting message box is at 2"""
 
+    _ELEMENTS_IDENTIFIER: ClassVar[Dict[str, str]] = {
+        "Email": '//*[@id="email"]',
+        "Login_Button": "/html/body/div[2]/div/main/div[1]/div/div[1]/form/button",
+        "Login_Code": "/html/body/div[2]/div/main/div[1]/div/div[1]/form/div[3]/input",
+        "Login_Code_Confirmation": "/html/body/div[2]/div/main/div[1]/div/div[1]/form/button",
+        "Start_Chat_Button": "/html/body/div[2]/div/main/div[1]/div[2]/div[1]/div/div/fieldset/div/div[2]/div[2]/button",
+        "Prompt_Text_Area": "/html/body/div[2]/div/div[2]/div/div[2]/div[2]/div[2]/div/div/div/div/fieldset/div[2]/div[1]/div[1]/div/div/div/div/p",  # noqa: E501
+        "Prompt_Text_Area_Submit": "/html/body/div[2]/div/div[2]/div/div[2]/div[2]/div[2]/div/div/div/div/fieldset/div[2]/div[1]/div[2]/div[2]/div/button",  # noqa: E501
+        "Prompt_Text_Area_Output": "/html/body/div[2]/div/div[2]/div/div[2]/div[2]/div[1]/div[{current}]/div/div/div[1]/div/div",
+    }
+
+    _MODEL_URL: ClassVar[str] = "https://claude.ai/login"
+
     @property
     def _model_url(self) -> str:
-        return "https://claude.ai/login"
+        return self._MODEL_URL
 
     @property
     def _elements_identifier(self) -> Dict[str, str]:
-        return {
-            "Email": '//*[@id="email"]',
-            "Login_Button": "/html/body/div[2]/div/main/div[1]/div/div[1]/form/button",
-            "Login_Code": "/html/body/div[2]/div/main/div[1]/div/div[1]/form/div[3]/input",
-            "Login_Code_Confirmation": "/html/body/div[2]/div/main/div[1]/div/div[1]/form/button",
-            "Start_Chat_Button": "/html/body/div[2]/div/main/div[1]/div[2]/div[1]/div/div/fieldset/div/div[2]/div[2]/button",
-            "Prompt_Text_Area": "/html/body/div[2]/div/div[2]/div/div[2]/div[2]/div[2]/div/div/div/div/fieldset/div[2]/div[1]/div[1]/div/div/div/div/p",  # noqa: E501
-            "Prompt_Text_Area_Submit": "/html/body/div[2]/div/div[2]/div/div[2]/div[2]/div[2]/div/div/div/div/fieldset/div[2]/div[1]/div[2]/div[2]/div/button",  # noqa: E501
-            "Prompt_Text_Area_Output": "/html/body/div[2]/div/div[2]/div/div[2]/div[2]/div[1]/div[{current}]/div/div/div[1]/div/div",
-        }
+        return self._ELEMENTS_IDENTIFIER
 
     def login(self, retries_attempt: int = 3) -> bool:
         self.driver.get(self._model_url)
+        try:  # A persisted profile may still hold the login cookies, in which case no verification code is needed
+            WebDriverWait(self.driver, 3).until(EC.presence_of_element_located((By.XPATH, self._elements_identifier["Start_Chat_Button"])))
+            self.run_manager.on_text(text="Already logged in on Claude", verbose=self.verbosity)
+            return True
+        except TimeoutException:
+            pass
         for i in range(retries_attempt):
             self.run_manager.on_text(text=f"Making login attempt no. {i+1} on Claude", verbose=self.verbosity)
             try:
-                email_input = WebDriverWait(self.driver, self.waiting_time).until(
+                email_input = self._wait.until(
                     EC.presence_of_element_located((By.XPATH, self._elements_identifier["Email"]))
                 )
                 email_input.clear()
                 email_input.send_keys(self.email)
-                login_button = WebDriverWait(self.driver, self.waiting_time).until(
+                login_button = self._wait.until(
                     EC.presence_of_element_located((By.XPATH, self._elements_identifier["Login_Button"]))
                 )
                 login_button.click()
-                login_code = WebDriverWait(self.driver, self.waiting_time).until(
+                login_code = self._wait.until(
                     EC.presence_of_element_located((By.XPATH, self._elements_identifier["Login_Code"]))
                 )
                 input_code = input(f"Please open your email {self.email} and type in verification code:")
                 login_code.send_keys(input_code)
-                login_code_confirmation = WebDriverWait(self.driver, self.waiting_time).until(
+                login_code_confirmation = self._wait.until(
                     EC.presence_of_element_located((By.XPATH, self._elements_identifier["Login_Code_Confirmation"]))
                 )
                 login_code_confirmation.click()
                 self.run_manager.on_text(text=f"Login succeed on attempt no. {i+1}", verbose=self.verbosity)
                 return True
             except TimeoutException:
+                time.sleep(2**i)  # Back off before retrying so a slow page is not hammered with reloads
                 continue
         return False
 
     def send_prompt(self, query: str) -> AIMessage:
         try:
-            start_chat_button = WebDriverWait(self.driver, self.waiting_time).until(
+            start_chat_button = self._wait.until(
                 EC.presence_of_element_located((By.XPATH, self._elements_identifier["Start_Chat_Button"]))
             )
             start_chat_button.click()
         except TimeoutException:
             pass
-        prompt_text_area = WebDriverWait(self.driver, self.waiting_time).until(
+        prompt_text_area = self._wait.until(
             EC.presence_of_element_located((By.XPATH, self._elements_identifier["Prompt_Text_Area"]))
         )
-        self.driver.execute_script(f"arguments[0].innerText = '{query}'", prompt_text_area)
+        self._fill_prompt(prompt_text_area, query)
 
-        prompt_text_area_submit = WebDriverWait(self.driver, self.waiting_time).until(
+        prompt_text_area_submit = self._wait.until(
             EC.presence_of_element_located((By.XPATH, self._elements_identifier["Prompt_Text_Area_Submit"]))
         )
         prompt_text_area_submit.click()
-        time.sleep(self.waiting_time)
-        current_n, prev_n = 0, -1
-        while current_n != prev_n:
-            prev_n = current_n
-            streaming = self.driver.find_element(By.XPATH, self._elements_identifier["Prompt_Text_Area_Output"].format(current=self.message_box_jump))
-            raw_message = streaming.get_attribute("innerHTML")
-            self.run_manager.on_text(text="Claude is responding", verbose=self.verbosity)
-            current_n = len(raw_message) if raw_message is not None else 0
+        output_locator = (By.XPATH, self._elements_identifier["Prompt_Text_Area_Output"].format(current=self.message_box_jump))
+        self._wait.until(EC.presence_of_element_located(output_locator))  # Returns as soon as the response starts instead of a fixed sleep
+        raw_message = self._wait_streaming_finished(output_locator)
+        if raw_message is None:  # Fall back to polling when the observer could not be installed
+            raw_message = self._poll_until_stable(output_locator, "Claude")
         self.message_box_jump += 2
         self.run_manager.on_text(text=f"Claude responded with {len(raw_message)} characters", verbose=self.verbosity)
-        self.messages.append((HumanMessage(content=query), AIMessage(content=raw_message)))
+        self._human_contents.append(query)
+        self._ai_contents.append(raw_message)
         return AIMessage(content=raw_message)
@@ -0,0 +1,92 @@
+"""Warm Chrome pool shared across LLMChrome sessions"""
+
+import atexit
+import queue
+from typing import Dict, List, Optional, Tuple
+
+import undetected_chromedriver as uc
+from selenium.common.exceptions import WebDriverException
+
+
+class ChromePool:
+    """
+    Keeps warm Chrome processes for reuse across sessions, keyed by their driver configuration.
+
+    Launching undetected-chromedriver dominates session setup time, so instead of quitting
+    Chrome when a session ends, the driver is parked here and handed to the next session
+    started with the same configuration. Drivers are only pooled together when their full
+    argument list matches, since flags like the user data directory change browser state.
+    """
+
+    def __init__(self, maxsize: int = 4, max_uses_per_instance: int = 50) -> None:
+        self._maxsize = maxsize
+        self._max_uses = max_uses_per_instance
+        self._pools: Dict[Tuple[str, ...], "queue.Queue[uc.Chrome]"] = {}
+        self._uses: Dict[int, int] = {}
+        """Sessions served per driver (keyed by id), so long-lived Chromes are retired before leaked renderer memory builds up"""
+
+    def acquire(self, driver_config: List[str]) -> Optional[uc.Chrome]:
+        """
+        Returns a warm driver previously released under the same configuration.
+
+        Args:
+        driver_config (List[str]): The full list of Chrome arguments the driver was started with.
+
+        Returns:
+        Optional[uc.Chrome]: A reset driver, or None when no idle driver exists so the caller spawns a fresh one.
+        """
+        pool = self._pools.get(tuple(driver_config))
+        if pool is None:
+            return None
+        try:
+            driver = pool.get_nowait()
+        except queue.Empty:
+            return None
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except WebDriverException:  # The pooled Chrome died while idle; quit it so the chromedriver subprocess is not leaked
+            self._uses.pop(id(driver), None)
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+            return None
+        return driver
+
+    def release(self, driver_config: List[str], driver: uc.Chrome) -> None:
+        """
+        Parks a driver for reuse by later sessions with the same configuration.
+
+        Args:
+        driver_config (List[str]): The full list of Chrome arguments the driver was started with.
+        driver (uc.Chrome): The driver to park. Quit instead when the pool is already full,
+        the driver cannot be reset, or it has served max_uses_per_instance sessions.
+        """
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        if self._uses[id(driver)] >= self._max_uses:
+            del self._uses[id(driver)]
+            driver.quit()
+            return
+        pool = self._pools.setdefault(tuple(driver_config), queue.Queue(maxsize=self._maxsize))
+        try:
+            driver.delete_all_cookies()
+            pool.put_nowait(driver)
+        except (queue.Full, WebDriverException):
+            self._uses.pop(id(driver), None)
+            driver.quit()
+
+    def drain(self) -> None:
+        """Quits every pooled Chrome. Call at process shutdown to not leave browsers behind."""
+        for pool in self._pools.values():
+            while True:
+                try:
+                    pool.get_nowait().quit()
+                except queue.Empty:
+                    break
+
+
+DRIVER_POOL = ChromePool()
+"""The process-wide pool used by LLMChrome"""
+
+atexit.register(DRIVER_POOL.drain)  # Parked drivers outlive every session, so quit them at interpreter shutdown
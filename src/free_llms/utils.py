@@ -1,10 +1,17 @@
 """Helper Functions for all of our models"""
 
+import random
 from typing import List
 
 import undetected_chromedriver as uc
 from fake_useragent import UserAgent
 
+_USER_AGENT = UserAgent(browsers="chrome")
+"""Constructed once at import time since UserAgent re-parses its bundled data file on every construction"""
+
+_UA_POOL = [_USER_AGENT.random for _ in range(64)]
+"""Pre-sampled agents so configure_options picks with random.choice instead of re-filtering the database per call"""
+
 
 def configure_options(driver_config: List[str]) -> uc.ChromeOptions:
     """
@@ -17,8 +24,10 @@ def configure_options(driver_config: List[str]) -> uc.ChromeOptions:
     uc.ChromeOptions: Configured Chrome options.
     """
     chrome_options = uc.ChromeOptions()
-    userAgent = UserAgent(browsers="chrome").random
+    userAgent = random.choice(_UA_POOL)
     for arg in driver_config:
         chrome_options.add_argument(arg)
     chrome_options.add_argument(f"--user-agent={userAgent}")
+    chrome_options.page_load_strategy = "eager"  # driver.get returns at DOMContentLoaded; element readiness is gated by explicit waits
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     return chrome_options
@@ -0,0 +1,62 @@
+from free_llms.cache import LLMCache
+from free_llms.langchain_model import FreeLLMs
+from free_llms.models import AIMessage
+
+
+class _StubClient:
+    """Stands in for an LLMChrome so the cache path can be exercised without a browser."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def send_prompt(self, query):
+        self.calls += 1
+        return AIMessage(content="I am doing fine.")
+
+
+def test_llm_cache_exact_hit():
+    cache = LLMCache(maxsize=2)
+    key = LLMCache.make_key("GPTChrome", "How are you doing?")
+    assert cache.get(key) is None
+    cache.set(key, "I am doing fine.")
+    assert cache.get(key) == "I am doing fine."
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+
+def test_llm_cache_lru_eviction():
+    cache = LLMCache(maxsize=2)
+    keys = [LLMCache.make_key("GPTChrome", prompt) for prompt in ["first", "second", "third"]]
+    for key in keys:
+        cache.set(key, "answer")
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) == "answer"
+    assert cache.get(keys[2]) == "answer"
+
+
+def test_llm_cache_persistence(tmp_path):
+    persist_path = tmp_path / "cache.json"
+    cache = LLMCache(persist_path=persist_path)
+    key = LLMCache.make_key("MistralChrome", "How are you doing?")
+    cache.set(key, "I am doing fine.")
+    reloaded = LLMCache(persist_path=persist_path)
+    assert reloaded.get(key) == "I am doing fine."
+
+
+def test_llm_cache_ttl_survives_reload(tmp_path):
+    persist_path = tmp_path / "cache.json"
+    key = LLMCache.make_key("GPTChrome", "How are you doing?")
+    live = LLMCache(ttl=1000, persist_path=persist_path)
+    live.set(key, "I am doing fine.")
+    assert LLMCache(persist_path=persist_path).get(key) == "I am doing fine."
+    expired = LLMCache(ttl=-1, persist_path=tmp_path / "expired.json")
+    expired.set(key, "I am doing fine.")
+    assert LLMCache(persist_path=tmp_path / "expired.json").get(key) is None
+
+
+def test_free_llms_invoke_uses_response_cache():
+    client = _StubClient()
+    model = FreeLLMs.construct(client=client, model_name="GPTChrome", llm_kwargs={}, response_cache=LLMCache())
+    assert model.invoke("How are you doing?") == "I am doing fine."
+    assert model.invoke("How are you doing?") == "I am doing fine."
+    assert client.calls == 1
+    assert model.response_cache.stats == {"hits": 1, "misses": 1}
@@ -6,7 +6,7 @@ from free_llms.models import AIMessage, ClaudeChrome, GPTChrome, MistralChrome,
 def test_gpt_chrome():
     assert GPTChrome(driver_config=[], email="", password="")._elements_identifier == {
             "Prompt_Text_Area": "prompt-textarea",
-            "Prompt_Text_Output": '/html/body/div[1]/div[1]/div[2]/main/div[2]/div[1]/div/div/div/div/div[{current}]/div/div/div[2]/div[2]/div[1]/div/div',  # noqa: E501
+            "Prompt_Text_Output": 'div[data-message-author-role="assistant"]',
         }
     assert GPTChrome(driver_config=[], email="", password="")._model_url == "https://chatgpt.com/"
     chrome_instance = GPTChrome(driver_config=[], email="", password="", retries_attempt=1)